@@ -1,19 +1,94 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import gzip
+import io
 import json
+import logging
+import multiprocessing
 import os
+import queue
 import random
+import re
+import sys
+import threading
+from contextlib import contextmanager
+from logging.handlers import MemoryHandler
+from multiprocessing.util import Finalize
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import AsyncGenerator, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
 
+import httpx
+import lxml.html
+import requests
+from lxml import etree
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from fake_useragent import UserAgent
 
+log = logging.getLogger("scrape")
+log.setLevel(logging.WARNING)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import h2  # noqa: F401 - HTTP/2 no httpx depende do pacote opcional "h2"
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+
+@functools.lru_cache(maxsize=256)
+def _xp(expr: str) -> etree.XPath:
+    # Toda XPath do lxml passa por aqui: a mesma string nunca é compilada duas vezes.
+    # smart_strings=False devolve str simples, sem manter referência à árvore
+    return etree.XPath(expr, smart_strings=False)
+
+
+# XPaths compiladas uma única vez e reutilizadas em todas as citações/páginas
+_QUOTES_XP = _xp("//div[@class='quote']")
+# string() devolve o texto já serializado pelo lxml, sem lista intermediária
+_TEXT_XP = _xp("string(./span[@class='text'])")
+_AUTHOR_XP = _xp("string(./span/small[@class='author'])")
+_TAGS_XP = _xp("./div[@class='tags']/a[@class='tag']/text()")
+_NEXT_XP = _xp("//ul[@class='pager']/li[@class='next']/a/@href")
+
+# Extrai todas as citações da página com um único comando WebDriver (classe exata, como nas XPaths)
+_QUOTES_JS = """
+return Array.from(document.querySelectorAll('div[class="quote"]')).map(q => ({
+  quote: q.querySelector(':scope > span[class="text"]')?.textContent ?? null,
+  author: q.querySelector(':scope > span > small[class="author"]')?.textContent ?? null,
+  tags: Array.from(q.querySelectorAll(':scope > div[class="tags"] > a[class="tag"]')).map(t => t.textContent)
+}));
+"""
+
+
+_FALLBACK_UAS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:131.0) Gecko/20100101 Firefox/131.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.6 Safari/605.1.15",
+)
+
+# A base de user-agents é carregada uma única vez, na importação do módulo
+try:
+    _UA: Optional[UserAgent] = UserAgent()
+except Exception:
+    _UA = None
+
 
 def _apply_proxy_env(proxy_url: Optional[str]) -> None:
     if not proxy_url:
@@ -25,12 +100,25 @@ def _apply_proxy_env(proxy_url: Optional[str]) -> None:
 
 def _chrome_options(user_agent: str, proxy_url: Optional[str] = None) -> ChromeOptions:
     chrome_options = ChromeOptions()
+    # driver.get retorna no DOMContentLoaded; o WebDriverWait garante as citações
+    chrome_options.page_load_strategy = "eager"
     chrome_options.add_argument(f"--user-agent={user_agent}")
     chrome_options.add_argument("--disable-blink-features=AutomationControlled")
     chrome_options.add_argument("--start-maximized")
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_argument("--disable-dev-shm-usage")
     chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-background-networking")
+    # Só o texto interessa: bloqueia imagens, CSS, fontes e plugins
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.stylesheets": 2,
+        "profile.managed_default_content_settings.fonts": 2,
+        "profile.managed_default_content_settings.plugins": 2,
+    })
     if proxy_url:
         chrome_options.add_argument(f"--proxy-server={proxy_url}")
     return chrome_options
@@ -43,8 +131,8 @@ def _build_chrome(user_agent: str, proxy_url: Optional[str] = None) -> webdriver
     try:
         return webdriver.Chrome(options=options)
     except Exception as exc:
-        print("[WARN] Selenium Manager falhou ao resolver o driver automaticamente.")
-        print(f"[WARN] Erro: {exc}")
+        log.warning("Selenium Manager falhou ao resolver o driver automaticamente.")
+        log.warning("Erro: %s", exc)
 
     # 2) Fallback: tenta um chromedriver local por variável de ambiente ou pasta drivers/
     local_driver = os.environ.get("CHROMEDRIVER")
@@ -52,7 +140,7 @@ def _build_chrome(user_agent: str, proxy_url: Optional[str] = None) -> webdriver
         local_driver = str(Path("drivers") / ("chromedriver.exe" if os.name == "nt" else "chromedriver"))
 
     if Path(local_driver).exists():
-        print(f"[INFO] Usando chromedriver local: {local_driver}")
+        log.info("Usando chromedriver local: %s", local_driver)
         from selenium.webdriver.chrome.service import Service as ChromeService
 
         service = ChromeService(executable_path=local_driver)
@@ -65,125 +153,574 @@ def _build_chrome(user_agent: str, proxy_url: Optional[str] = None) -> webdriver
     )
 
 
-def _random_user_agent() -> str:
-    try:
-        ua = UserAgent()
-        return ua.random
-    except Exception:
-        fallback_list = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:131.0) Gecko/20100101 Firefox/131.0",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.6 Safari/605.1.15",
-        ]
-        return random.choice(fallback_list)
-
-
-def scrape_first_page(url: str = "https://quotes.toscrape.com/", proxy_url: Optional[str] = None) -> List[Dict[str, str]]:
+def _random_user_agent(rng: Optional[random.Random] = None) -> str:
+    # Com um random.Random semeado a escolha fica reprodutível (lista fixa de fallback)
+    if _UA is not None and rng is None:
+        try:
+            return _UA.random
+        except Exception:
+            pass
+    return (rng or random).choice(_FALLBACK_UAS)
+
+
+class DriverPool:
+    # Mantém navegadores abertos para reaproveitá-los entre páginas e chamadas
+    def __init__(self, user_agent: str, proxy_url: Optional[str] = None, size: int = 1) -> None:
+        self.user_agent = user_agent
+        self.proxy_url = proxy_url
+        self.size = size
+        self._idle: "queue.Queue[webdriver.Chrome]" = queue.Queue()
+        self._drivers: List[webdriver.Chrome] = []
+        self._lock = threading.Lock()
+
+    def _get(self) -> webdriver.Chrome:
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+            with self._lock:
+                if len(self._drivers) < self.size:
+                    # Criação preguiçosa: o navegador só sobe quando é realmente necessário
+                    driver = _build_chrome(self.user_agent, self.proxy_url)
+                    self._drivers.append(driver)
+                    return driver
+            # Pool cheio: espera uma devolução, reavaliando caso close() libere espaço
+            try:
+                return self._idle.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+    @contextmanager
+    def acquire(self) -> Iterator[webdriver.Chrome]:
+        driver = self._get()
+        try:
+            yield driver
+        finally:
+            with self._lock:
+                # Se close() rodou durante o uso, o driver já foi encerrado e não volta para a fila
+                if driver in self._drivers:
+                    self._idle.put(driver)
+
+    def close(self) -> None:
+        with self._lock:
+            for driver in self._drivers:
+                driver.quit()
+            self._drivers.clear()
+            while True:
+                try:
+                    self._idle.get_nowait()
+                except queue.Empty:
+                    break
+        log.info("Navegador encerrado.")
+
+
+@contextmanager
+def _driver_pool_for(
+    proxy_url: Optional[str] = None, driver_pool: Optional[DriverPool] = None
+) -> Iterator[DriverPool]:
+    # Reaproveita o pool recebido (com o user-agent e o proxy dele); caso contrário cria um temporário
+    if driver_pool is not None:
+        if proxy_url is not None and proxy_url != driver_pool.proxy_url:
+            log.warning("Proxy %s ignorado: o pool de navegadores usa %s", proxy_url, driver_pool.proxy_url)
+        yield driver_pool
+        return
     user_agent = _random_user_agent()
-    print(f"[INFO] Iniciando navegador com user-agent: {user_agent}")
     if proxy_url:
-        print(f"[INFO] Usando proxy: {proxy_url}")
-    driver = _build_chrome(user_agent, proxy_url)
-    wait = WebDriverWait(driver, 15)
+        log.info("Usando proxy: %s", proxy_url)
+    log.info("Iniciando navegador com user-agent: %s", user_agent)
+    pool = DriverPool(user_agent, proxy_url)
+    try:
+        yield pool
+    finally:
+        pool.close()
 
-    data: List[Dict[str, str]] = []
+
+def _new_session(user_agent: str, proxy_url: Optional[str] = None) -> requests.Session:
+    # Uma única sessão mantém a conexão aberta (keep-alive) entre as páginas
+    session = requests.Session()
+    session.headers.update({"User-Agent": user_agent})
+    if proxy_url:
+        session.proxies.update({"http": proxy_url, "https": proxy_url})
+    return session
+
+
+def _fetch(session: requests.Session, url: str) -> bytes:
+    resp = session.get(url, timeout=15)
+    resp.raise_for_status()
+    return resp.content
+
+
+_PAGE_URL_RE = re.compile(r"^(?P<base>.*?/)(?:page/(?P<n>\d+)/)?$")
+
+
+def _split_page_url(start_url: str) -> Tuple[str, int]:
+    # ".../page/3/" -> (".../", 3); sem o sufixo, a URL inicial é a página 1
+    url = start_url if start_url.endswith("/") else start_url + "/"
+    parts = urlsplit(url)
+    match = _PAGE_URL_RE.match(url)
+    if parts.query or parts.fragment or match is None:
+        raise ValueError(f"URL inicial fora do padrão .../page/N/: {start_url}")
+    return match.group("base"), int(match.group("n") or 1)
+
+
+def _page_url(base_url: str, page_n: int) -> str:
+    return f"{base_url}page/{page_n}/"
+
+
+def _new_async_client(user_agent: str, proxy_url: Optional[str] = None, max_connections: int = 10) -> httpx.AsyncClient:
+    # Um único cliente multiplexa as requisições (HTTP/2 quando disponível) sobre a mesma conexão
+    return httpx.AsyncClient(
+        http2=_HTTP2,
+        headers={"User-Agent": user_agent},
+        proxy=proxy_url,
+        timeout=15,
+        limits=httpx.Limits(max_connections=max_connections),
+        follow_redirects=True,
+    )
+
+
+def _make_item(quote_text: str, author: str, tags: List[str]) -> Dict[str, str]:
+    # Autores e tags se repetem muito entre citações: sys.intern faz as cópias compartilharem um único objeto
+    return {"quote": quote_text, "author": sys.intern(author), "tags": [sys.intern(t) for t in tags]}
+
+
+def _parse_page_lexbor(content: bytes) -> Tuple[List[Dict[str, str]], bool]:
+    # Mesmas regras das XPaths: classe exata e eixo filho. O lexbor não aceita ":scope",
+    # então cada seletor parte de div.quote (o nó de contexto, já que citações não se aninham)
+    tree = LexborHTMLParser(content)
+    items: List[Dict[str, str]] = []
+    for idx, q in enumerate(tree.css('div[class="quote"]'), start=1):
+        quote_node = q.css_first('div[class="quote"] > span[class="text"]')
+        author_node = q.css_first('div[class="quote"] > span > small[class="author"]')
+        quote_text = quote_node.text() if quote_node is not None else ""
+        author = author_node.text() if author_node is not None else ""
+        if not quote_text or not author:
+            log.warning("Falha ao coletar elementos da citação #%s", idx)
+            continue
+        tags = [t.text() for t in q.css('div[class="quote"] > div[class="tags"] > a[class="tag"]')]
+        items.append(_make_item(quote_text, author, tags))
+    return items, tree.css_first('ul[class="pager"] > li[class="next"] > a') is not None
+
+
+def _parse_page(content: bytes) -> Tuple[List[Dict[str, str]], bool]:
+    # selectolax (lexbor, em C) é o parser preferido; lxml fica como fallback
+    if LexborHTMLParser is not None:
+        return _parse_page_lexbor(content)
+    tree = lxml.html.fromstring(content)
+    return _parse_quotes(tree), bool(_NEXT_XP(tree))
+
+
+def _load_http_cache(path: str) -> Dict[str, dict]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    # Reconstrói os itens para que autores e tags voltem a ser internados.
+    # Um cache em outro formato (ex.: só {url: etag}) é tratado como ausente
     try:
-        print(f"[INFO] Acessando URL: {url}")
-        driver.get(url)
+        for entry in cache.values():
+            entry["items"] = [_make_item(i["quote"], i["author"], i["tags"]) for i in entry["items"]]
+            entry["has_next"] = bool(entry["has_next"])
+    except (TypeError, KeyError, AttributeError):
+        log.warning("Cache HTTP em formato inesperado, ignorando: %s", path)
+        return {}
+    return cache
+
+
+def _save_http_cache(cache: Dict[str, dict], path: str) -> None:
+    # Grava num arquivo temporário e troca de uma vez: uma execução interrompida não corrompe o cache
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+async def _fetch_page_async(
+    client: httpx.AsyncClient,
+    url: str,
+    http_cache: Optional[Dict[str, dict]] = None,
+    missing_is_empty: bool = False,
+) -> Tuple[List[Dict[str, str]], bool]:
+    # GET condicional: se a página não mudou desde a última coleta, o servidor responde 304 e o parse é pulado
+    entry = http_cache.get(url) if http_cache is not None else None
+    headers: Dict[str, str] = {}
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    resp = await client.get(url, headers=headers)
+    if resp.status_code == 304 and entry:
+        return entry["items"], entry["has_next"]
+    if resp.status_code == 404 and missing_is_empty:
+        # Lotes concorrentes podem passar da última página: trata como página vazia
+        return [], False
+    resp.raise_for_status()
+    # O parse é CPU-bound: roda no pool de threads para não bloquear o event loop
+    loop = asyncio.get_running_loop()
+    items, has_next = await loop.run_in_executor(None, _parse_page, resp.content)
+
+    etag = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+    if http_cache is not None and (etag or last_modified):
+        http_cache[url] = {"etag": etag, "last_modified": last_modified, "items": items, "has_next": has_next}
+    return items, has_next
+
+
+def _parse_quotes(tree: lxml.html.HtmlElement) -> List[Dict[str, str]]:
+    items: List[Dict[str, str]] = []
+    for idx, q in enumerate(_QUOTES_XP(tree), start=1):
+        quote_text = _TEXT_XP(q)
+        author = _AUTHOR_XP(q)
+        tags = _TAGS_XP(q)
+        if not quote_text or not author:
+            log.warning("Falha ao coletar elementos da citação #%s", idx)
+            continue
+        items.append(_make_item(quote_text, author, tags))
+    return items
+
+
+def iter_quotes_from_dump(source: Union[str, BinaryIO]) -> Iterator[Dict[str, str]]:
+    # Parse em streaming para dumps HTML grandes: cada citação é liberada logo após a extração
+    for _, elem in etree.iterparse(source, events=("end",), tag="div", html=True):
+        if elem.get("class") != "quote":
+            continue
+        quote_text = _TEXT_XP(elem)
+        author = _AUTHOR_XP(elem)
+        if quote_text and author:
+            yield _make_item(quote_text, author, _TAGS_XP(elem))
+        else:
+            log.warning("Falha ao coletar elementos de uma citação do dump")
+        elem.clear()
+        # Remove também o que já foi processado acima da citação (cabeçalho, pager, páginas anteriores),
+        # senão a árvore cresce com o número de páginas do dump
+        for node in (elem, *elem.iterancestors()):
+            parent = node.getparent()
+            while parent is not None and node.getprevious() is not None:
+                del parent[0]
+
+
+def _collect_quotes_selenium(driver: webdriver.Chrome) -> List[Dict[str, str]]:
+    items: List[Dict[str, str]] = []
+    for idx, item in enumerate(driver.execute_script(_QUOTES_JS) or [], start=1):
+        if not item["quote"] or not item["author"]:
+            log.warning("Falha ao coletar elementos da citação #%s", idx)
+            continue
+        items.append(_make_item(item["quote"], item["author"], item["tags"]))
+    return items
+
+
+def _load_quotes_selenium(driver: webdriver.Chrome, url: str) -> List[Dict[str, str]]:
+    log.info("Acessando URL: %s", url)
+    driver.get(url)
+    # Basta a primeira citação: o HTML estático traz todas de uma vez.
+    # Depois da última página o site responde "No quotes found!", que também encerra a espera
+    WebDriverWait(driver, timeout=15, poll_frequency=0.1).until(
+        EC.any_of(
+            EC.presence_of_element_located((By.CSS_SELECTOR, 'div[class="quote"]')),
+            # A coluna de conteúdo, não a do cabeçalho (div.header-box também tem um div.col-md-8)
+            EC.presence_of_element_located(
+                (By.XPATH, "//div[@class='row']/div[@class='col-md-8'][contains(., 'No quotes found')]")
+            ),
+        )
+    )
+    return _collect_quotes_selenium(driver)
 
-        # Espera pela lista de citações
-        wait.until(EC.presence_of_all_elements_located((By.XPATH, "//div[@class='quote']")))
-        quotes = driver.find_elements(By.XPATH, "//div[@class='quote']")
-        print(f"[INFO] Quantidade de citações encontradas: {len(quotes)}")
 
-        for idx, q in enumerate(quotes, start=1):
-            try:
-                quote_text = q.find_element(By.XPATH, ".//span[@class='text']").text
-                author = q.find_element(By.XPATH, ".//small[@class='author']").text
-                tag_elements = q.find_elements(By.XPATH, ".//div[@class='tags']/a[@class='tag']")
-                tags = [t.text for t in tag_elements]
-                item = {"quote": quote_text, "author": author, "tags": tags}
-                data.append(item)
-                print(f"[OK] Coletada citação #{idx} de '{author}' com {len(tags)} tag(s)")
-            except NoSuchElementException:
-                print(f"[WARN] Falha ao coletar elementos da citação #{idx}")
+def _scrape_first_page_selenium(url: str, pool: DriverPool) -> List[Dict[str, str]]:
+    data: List[Dict[str, str]] = []
+    with pool.acquire() as driver:
+        try:
+            data = _load_quotes_selenium(driver, url)
+            log.info("Quantidade de citações encontradas: %s", len(data))
+            for idx, item in enumerate(data, start=1):
+                log.debug("Coletada citação #%s de '%s' com %s tag(s)", idx, item['author'], len(item['tags']))
+        except TimeoutException:
+            log.error("Tempo de espera excedido ao carregar os elementos da página.")
 
-    except TimeoutException:
-        print("[ERRO] Tempo de espera excedido ao carregar os elementos da página.")
-    finally:
-        driver.quit()
-        print("[INFO] Navegador encerrado.")
+    return data
+
+
+def scrape_first_page(
+    url: str = "https://quotes.toscrape.com/",
+    proxy_url: Optional[str] = None,
+    use_selenium: bool = False,
+    driver_pool: Optional[DriverPool] = None,
+) -> List[Dict[str, str]]:
+    if use_selenium:
+        # Navegador completo apenas para sites que dependem de JavaScript
+        with _driver_pool_for(proxy_url, driver_pool) as pool:
+            return _scrape_first_page_selenium(url, pool)
+
+    if proxy_url:
+        log.info("Usando proxy: %s", proxy_url)
+    user_agent = _random_user_agent()
+    log.info("Iniciando sessão HTTP com user-agent: %s", user_agent)
+    data: List[Dict[str, str]] = []
+    with _new_session(user_agent, proxy_url) as session:
+        try:
+            log.info("Acessando URL: %s", url)
+            content = _fetch(session, url)
+        except requests.RequestException as exc:
+            log.error("Falha ao carregar a página: %s", exc)
+            return data
+
+        data, _ = _parse_page(content)
+        log.info("Quantidade de citações encontradas: %s", len(data))
+        for idx, item in enumerate(data, start=1):
+            log.debug("Coletada citação #%s de '%s' com %s tag(s)", idx, item['author'], len(item['tags']))
 
     return data
 
 
-def save_to_txt(items: List[Dict[str, str]], path: str = "resposta.txt") -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        for obj in items:
-            f.write(json.dumps(obj, ensure_ascii=False) + "\n")
-    print(f"[INFO] Arquivo salvo em: {path}")
+def _dumps(obj: Dict[str, str]) -> bytes:
+    # orjson já devolve UTF-8; o fallback usa os mesmos separadores compactos para manter o arquivo idêntico
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
 
 
-def scrape_all_pages(start_url: str = "https://quotes.toscrape.com/", proxy_url: Optional[str] = None) -> List[Dict[str, str]]:
-    user_agent = _random_user_agent()
-    if proxy_url:
-        print(f"[INFO] Usando proxy: {proxy_url}")
-    print(f"[INFO] Iniciando navegador com user-agent: {user_agent}")
-    driver = _build_chrome(user_agent, proxy_url)
-    wait = WebDriverWait(driver, 15)
+def _write_jsonl(f: BinaryIO, items: Iterable[Dict[str, str]]) -> int:
+    # Consome o iterável à medida que as citações chegam, sem montar a lista inteira em memória
+    count = 0
+    for obj in items:
+        f.write(_dumps(obj))
+        f.write(b"\n")
+        count += 1
+    return count
+
+
+def save_to_txt(items: Iterable[Dict[str, str]], path: str = "resposta.txt") -> int:
+    with open(path, "wb", buffering=1 << 20) as f:
+        count = _write_jsonl(f, items)
+    log.info("Arquivo salvo em: %s", path)
+    return count
+
 
+def save_to_jsonl_gz(items: Iterable[Dict[str, str]], path: str = "resposta.jsonl.gz") -> int:
+    # compresslevel=1 prioriza velocidade; o buffer agrupa as linhas antes de chegar ao compressor
+    with io.BufferedWriter(gzip.open(path, "wb", compresslevel=1), buffer_size=1 << 20) as f:
+        count = _write_jsonl(f, items)
+    log.info("Arquivo salvo em: %s", path)
+    return count
+
+
+def save_to_parquet(cols: Dict[str, list], path: str = "resposta.parquet") -> None:
+    # pyarrow é opcional e pesado: só é importado quando o Parquet é realmente pedido
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    pq.write_table(pa.Table.from_pydict(cols), path)
+    log.info("Arquivo salvo em: %s", path)
+
+
+def _scrape_all_pages_selenium(start_url: str, pool: DriverPool) -> List[Dict[str, str]]:
     all_items: List[Dict[str, str]] = []
+    # As URLs seguem o padrão /page/N/: avança contando em vez de consultar o link "next"
+    base_url, page_n = _split_page_url(start_url)
     current_url = start_url
 
-    try:
-        while True:
-            print(f"[INFO] Acessando URL: {current_url}")
-            driver.get(current_url)
+    with pool.acquire() as driver:
+        try:
+            while True:
+                items = _load_quotes_selenium(driver, current_url)
+                if not items:
+                    log.info("Não há mais páginas. Coleta finalizada.")
+                    break
+                log.info("Quantidade de citações encontradas nesta página: %s", len(items))
+                for item in items:
+                    log.debug("Citação de '%s' coletada", item['author'])
+                all_items.extend(items)
+
+                page_n += 1
+                current_url = _page_url(base_url, page_n)
+                log.info("Avançando para a próxima página: %s", current_url)
+
+        except TimeoutException:
+            log.error("Tempo de espera excedido ao carregar os elementos da página.")
 
-            wait.until(EC.presence_of_all_elements_located((By.XPATH, "//div[@class='quote']")))
-            quotes = driver.find_elements(By.XPATH, "//div[@class='quote']")
-            print(f"[INFO] Quantidade de citações encontradas nesta página: {len(quotes)}")
+    return all_items
 
-            for idx, q in enumerate(quotes, start=1):
-                try:
-                    quote_text = q.find_element(By.XPATH, ".//span[@class='text']").text
-                    author = q.find_element(By.XPATH, ".//small[@class='author']").text
-                    tag_elements = q.find_elements(By.XPATH, ".//div[@class='tags']/a[@class='tag']")
-                    tags = [t.text for t in tag_elements]
-                    all_items.append({"quote": quote_text, "author": author, "tags": tags})
-                    print(f"[OK] Citação de '{author}' coletada")
-                except NoSuchElementException:
-                    print("[WARN] Falha ao coletar uma citação desta página")
-
-            # Tenta ir para a próxima página
-            try:
-                next_link = driver.find_element(By.XPATH, "//li[@class='next']/a")
-                next_href = next_link.get_attribute("href")
-                if not next_href:
-                    # alguns sites usam href relativo
-                    next_href = next_link.get_attribute("href") or next_link.get_attribute("data-href")
-                current_url = next_href if next_href else driver.current_url.rstrip('/') + "/page/2/"
-                print(f"[INFO] Avançando para a próxima página: {current_url}")
-            except NoSuchElementException:
-                print("[INFO] Não há mais páginas. Coleta finalizada.")
-                break
 
+_WORKER_DRIVER: Optional[webdriver.Chrome] = None
+
+
+def _init_selenium_worker(user_agent: str, proxy_url: Optional[str] = None) -> None:
+    # Cada processo do pool mantém um navegador persistente para todas as URLs que receber
+    global _WORKER_DRIVER
+    _WORKER_DRIVER = _build_chrome(user_agent, proxy_url)
+    Finalize(None, _WORKER_DRIVER.quit, exitpriority=10)
+
+
+def _scrape_url_selenium_worker(url: str) -> List[Dict[str, str]]:
+    try:
+        return _load_quotes_selenium(_WORKER_DRIVER, url)
     except TimeoutException:
-        print("[ERRO] Tempo de espera excedido ao carregar os elementos da página.")
+        log.error("Tempo de espera excedido ao carregar %s", url)
+        return []
+
+
+def scrape_pages_selenium(urls: List[str], proxy_url: Optional[str] = None, processes: int = 4) -> List[Dict[str, str]]:
+    user_agent = _random_user_agent()
+    log.info("Iniciando %s navegador(es) com user-agent: %s", processes, user_agent)
+    pool = multiprocessing.Pool(processes, initializer=_init_selenium_worker, initargs=(user_agent, proxy_url))
+    try:
+        pages = pool.map(_scrape_url_selenium_worker, urls)
     finally:
-        driver.quit()
-        print("[INFO] Navegador encerrado.")
+        # close + join deixa os processos saírem normalmente e executarem o driver.quit()
+        pool.close()
+        pool.join()
+        log.info("Navegadores encerrados.")
+    return [item for page in pages for item in page]
+
+
+async def _aiter_pages(
+    start_url: str,
+    user_agent: str,
+    proxy_url: Optional[str] = None,
+    max_concurrency: int = 10,
+    cache_path: Optional[str] = None,
+) -> AsyncGenerator[List[Dict[str, str]], None]:
+    base_url, first_n = _split_page_url(start_url)
+    http_cache = _load_http_cache(cache_path) if cache_path else None
+    fetch = functools.partial(_fetch_page_async, http_cache=http_cache)
+    async with _new_async_client(user_agent, proxy_url, max_connections=max_concurrency) as client:
+        try:
+            # A primeira página revela se existe paginação
+            log.info("Acessando URL: %s", start_url)
+            items, has_next = await fetch(client, start_url)
+            log.info("Quantidade de citações encontradas nesta página: %s", len(items))
+            yield items
+            if not has_next:
+                log.info("Não há mais páginas. Coleta finalizada.")
+                return
+
+            # As URLs seguem o padrão /page/N/: busca lotes concorrentes até uma página vazia
+            page_n = first_n + 1
+            while True:
+                urls = [_page_url(base_url, n) for n in range(page_n, page_n + max_concurrency)]
+                log.info("Acessando páginas %s a %s", page_n, page_n + max_concurrency - 1)
+                pages = await asyncio.gather(*[fetch(client, url, missing_is_empty=True) for url in urls])
+                for url, (items, _) in zip(urls, pages):
+                    if not items:
+                        log.info("Não há mais páginas. Coleta finalizada.")
+                        return
+                    log.info("%s citações coletadas em %s", len(items), url)
+                    yield items
+                page_n += max_concurrency
+        except httpx.HTTPError as exc:
+            log.error("Falha ao carregar a página: %s", exc)
+        finally:
+            if cache_path:
+                _save_http_cache(http_cache, cache_path)
+
+
+async def scrape_all_pages(
+    start_url: str = "https://quotes.toscrape.com/",
+    proxy_url: Optional[str] = None,
+    use_selenium: bool = False,
+    max_concurrency: int = 10,
+    driver_pool: Optional[DriverPool] = None,
+    cache_path: Optional[str] = None,
+) -> List[Dict[str, str]]:
+    if use_selenium:
+        loop = asyncio.get_running_loop()
+        with _driver_pool_for(proxy_url, driver_pool) as pool:
+            return await loop.run_in_executor(None, _scrape_all_pages_selenium, start_url, pool)
 
+    if proxy_url:
+        log.info("Usando proxy: %s", proxy_url)
+    user_agent = _random_user_agent()
+    log.info("Iniciando cliente HTTP com user-agent: %s", user_agent)
+    all_items: List[Dict[str, str]] = []
+    async for items in _aiter_pages(start_url, user_agent, proxy_url, max_concurrency, cache_path):
+        all_items.extend(items)
     return all_items
 
 
+def _drive_pages(pages: AsyncGenerator[List[Dict[str, str]], None]) -> Iterator[Dict[str, str]]:
+    # Event loop próprio: cada lote de páginas é entregue assim que chega, mantendo o mesmo cliente HTTP
+    loop = asyncio.new_event_loop()
+    try:
+        while True:
+            try:
+                items = loop.run_until_complete(pages.__anext__())
+            except StopAsyncIteration:
+                break
+            yield from items
+    finally:
+        try:
+            loop.run_until_complete(pages.aclose())
+            loop.run_until_complete(loop.shutdown_default_executor())
+        finally:
+            loop.close()
+
+
+def iter_all_pages(
+    start_url: str = "https://quotes.toscrape.com/",
+    proxy_url: Optional[str] = None,
+    max_concurrency: int = 10,
+    cache_path: Optional[str] = None,
+) -> Iterator[Dict[str, str]]:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        raise RuntimeError(
+            "iter_all_pages não pode rodar dentro de um event loop ativo (notebook, async def). "
+            "Use 'await scrape_all_pages(...)' nesse caso."
+        )
+
+    user_agent = _random_user_agent()
+    if proxy_url:
+        log.info("Usando proxy: %s", proxy_url)
+    log.info("Iniciando cliente HTTP com user-agent: %s", user_agent)
+    return _drive_pages(_aiter_pages(start_url, user_agent, proxy_url, max_concurrency, cache_path))
+
+
+def scrape_all_pages_columnar(
+    start_url: str = "https://quotes.toscrape.com/",
+    proxy_url: Optional[str] = None,
+    max_concurrency: int = 10,
+    cache_path: Optional[str] = None,
+) -> Dict[str, list]:
+    # Layout colunar (dict de listas) pronto para pyarrow/pandas; os dicts de cada citação
+    # vêm do parse e são descartados assim que o item é distribuído nas colunas
+    quotes_col: List[str] = []
+    authors_col: List[str] = []
+    tags_col: List[List[str]] = []
+    for item in iter_all_pages(start_url, proxy_url, max_concurrency, cache_path):
+        quotes_col.append(item["quote"])
+        authors_col.append(item["author"])
+        tags_col.append(item["tags"])
+    return {"quote": quotes_col, "author": authors_col, "tags": tags_col}
+
+
+def _configure_logging(level: str = "WARNING") -> None:
+    # As mensagens ficam em memória e vão para o stdout em lote (ou imediatamente a partir de ERROR)
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
+    log.addHandler(MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=stream))
+    log.setLevel(level.upper())
+
+
 if __name__ == "__main__":
-    print("[INFO] Iniciando coleta de todas as páginas de quotes.toscrape.com")
+    # Ex.: LOG_LEVEL=INFO (ou DEBUG, para cada citação) mostra o progresso da coleta
+    _configure_logging(os.environ.get("LOG_LEVEL", "WARNING"))
+    log.info("Iniciando coleta de todas as páginas de quotes.toscrape.com")
     proxy_env = os.environ.get("PROXY_URL") or os.environ.get("HTTP_PROXY") or os.environ.get("HTTPS_PROXY")
     if proxy_env:
-        print(f"[INFO] Proxy detectado em ambiente: {proxy_env}")
-    results = scrape_all_pages("https://quotes.toscrape.com/", proxy_url=proxy_env)
-    print(f"[INFO] Total coletado: {len(results)} itens")
-    save_to_txt(results, "resposta.txt")
-
-
+        log.info("Proxy detectado em ambiente: %s", proxy_env)
+    # Ex.: ETAG_CACHE=cache/etags.json reaproveita as páginas que não mudaram desde a última execução
+    cache_env = os.environ.get("ETAG_CACHE")
+    if cache_env:
+        log.info("Cache HTTP (ETag/Last-Modified) em: %s", cache_env)
+    total = save_to_txt(
+        iter_all_pages("https://quotes.toscrape.com/", proxy_url=proxy_env, cache_path=cache_env), "resposta.txt"
+    )
+    log.info("Total coletado: %s itens", total)